@@ -227,7 +227,10 @@ def monitor_emails_with_full_content(dropmail: DropMail, logger: logging.Logger,
         last_mail_count = 0
     
     logger.info("🔍 Starting to monitor new emails...")
-    
+
+    # Exponential backoff: poll quickly at first, back off towards check_interval when idle
+    poll_interval = 1.0
+
     try:
         while True:
             try:
@@ -237,10 +240,10 @@ def monitor_emails_with_full_content(dropmail: DropMail, logger: logging.Logger,
                 else:
                     all_mails = dropmail.get_mails()
                     new_mails = all_mails[last_mail_count:] if len(all_mails) > last_mail_count else []
-                
+
                 if new_mails:
                     logger.info(f"🎉 Received {len(new_mails)} new email(s)!")
-                    
+
                     for mail in new_mails:
                         logger.info("=" * 80)
                         logger.info("📧 NEW EMAIL")
@@ -255,18 +258,24 @@ def monitor_emails_with_full_content(dropmail: DropMail, logger: logging.Logger,
                             logger.info("\nHTML Content:")
                             logger.info(mail.html)
                         logger.info("=" * 80)
-                    
+
                     # Update tracking variables
                     last_mail_id = new_mails[-1].id
                     last_mail_count += len(new_mails)
-                
+
+                    # New activity usually means more mail is coming, poll quickly again
+                    poll_interval = 1.0
+                else:
+                    poll_interval = min(poll_interval * 1.5, check_interval)
+
                 # Wait before next check
-                time.sleep(check_interval)
-                
+                time.sleep(poll_interval)
+
             except Exception as e:
                 logger.error(f"❌ Error checking emails: {e}")
-                time.sleep(check_interval)
-                
+                poll_interval = min(poll_interval * 1.5, check_interval)
+                time.sleep(poll_interval)
+
     except KeyboardInterrupt:
         logger.info("\n⏹️  Email monitoring stopped by user")
 
@@ -309,7 +318,10 @@ def monitor_emails(dropmail: DropMail, logger: logging.Logger, check_interval: i
         last_mail_count = 0
     
     logger.info("🔍 Starting to monitor new emails...")
-    
+
+    # Exponential backoff: poll quickly at first, back off towards check_interval when idle
+    poll_interval = 1.0
+
     try:
         while True:
             try:
@@ -319,11 +331,11 @@ def monitor_emails(dropmail: DropMail, logger: logging.Logger, check_interval: i
                 else:
                     all_mails = dropmail.get_mails()
                     new_mails = all_mails[last_mail_count:] if len(all_mails) > last_mail_count else []
-                
+
                 if new_mails:
                     logger.info(f"🎉 Received {len(new_mails)} new emails!")
                     logger.info("=" * 60)
-                    
+
                     for mail in new_mails:
                         logger.info(f"📧 New email:")
                         logger.info(f"   From: {mail.from_addr}")
@@ -332,19 +344,25 @@ def monitor_emails(dropmail: DropMail, logger: logging.Logger, check_interval: i
                         logger.info(f"   Time: {mail.received_at}")
                         logger.info(f"   Content preview: {mail.text[:100]}..." if len(mail.text) > 100 else f"   Content: {mail.text}")
                         logger.info("-" * 40)
-                    
+
                     # Update last mail ID and count
                     last_mail_id = new_mails[-1].id
                     last_mail_count += len(new_mails)
-                    
+
                     logger.info("🔍 Continue monitoring new emails...")
-                
-                time.sleep(check_interval)
-                
+
+                    # New activity usually means more mail is coming, poll quickly again
+                    poll_interval = 1.0
+                else:
+                    poll_interval = min(poll_interval * 1.5, check_interval)
+
+                time.sleep(poll_interval)
+
             except Exception as e:
                 logger.error(f"❌ Error checking emails: {e}")
-                time.sleep(check_interval)
-                
+                poll_interval = min(poll_interval * 1.5, check_interval)
+                time.sleep(poll_interval)
+
     except KeyboardInterrupt:
         logger.info("\n⚠️  Stopped email monitoring")
 
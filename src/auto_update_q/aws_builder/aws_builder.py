@@ -4,6 +4,8 @@ Using modular design, separation of concerns, clean code
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dataclasses import dataclass
 from selenium import webdriver
@@ -213,34 +215,79 @@ class AWSBuilder:
             self.logger.error(f"Component initialization failed: {e}")
             return False
     
-    def _execute_registration_flow(self, email: str, name: str, 
+    def _handle_email_verification(self, dropmail) -> bool:
+        """
+        Handle the email verification step
+
+        When a DropMail instance is available, the email poll and the
+        verification-input lookup run in parallel so the code can be typed
+        the moment it arrives, instead of locating the input afterwards.
+
+        Args:
+            dropmail: DropMail instance (optional)
+
+        Returns:
+            Whether the verification code was obtained and filled
+        """
+        if not dropmail:
+            # Manual path prompts the user on stdin, keep it sequential
+            verification_code = self.captcha_handler.wait_for_email_verification_code(
+                dropmail, timeout=300
+            )
+            if not verification_code:
+                return False
+            return self.form_handler.fill_verification_code(verification_code)
+
+        code_selectors = get_selector("verification_code_input")
+
+        # The driver is not thread-safe: the code-wait thread must not touch
+        # it (resend click) until the input lookup has released it
+        driver_free = threading.Event()
+
+        def locate_code_input():
+            try:
+                return self.element_waiter.wait_for_element_with_retry(
+                    code_selectors, "verification code input field"
+                )
+            finally:
+                driver_free.set()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            code_future = executor.submit(
+                self.captcha_handler.wait_for_email_verification_code,
+                dropmail, 300, driver_free
+            )
+            input_future = executor.submit(locate_code_input)
+            code_input = input_future.result()
+            verification_code = code_future.result()
+
+        if not verification_code:
+            return False
+
+        return self.form_handler.fill_verification_code(verification_code, code_input)
+
+    def _execute_registration_flow(self, email: str, name: str,
                                  password: Optional[str], dropmail) -> Optional[AWSBuilderCredentials]:
         """Execute registration flow"""
         # Navigate to registration page
         if not self._navigate_to_signup_page():
             return None
-        
+
         # Handle cookie consent
         self._handle_cookie_consent()
-        
+
         # Fill email form
         if not self.form_handler.fill_email_form(email):
             return None
-        
+
         # Fill name form
         if not self.form_handler.fill_name_form(name):
             return None
-        
+
         # Handle email verification code
-        verification_code = self.captcha_handler.wait_for_email_verification_code(
-            dropmail, timeout=300
-        )
-        if not verification_code:
-            return None
-        
-        if not self.form_handler.fill_verification_code(verification_code):
+        if not self._handle_email_verification(dropmail):
             return None
-        
+
         # Fill password form
         used_password = self.form_handler.fill_password_form(password)
         if not used_password:
@@ -285,17 +332,11 @@ class AWSBuilder:
         # Fill name form
         if not self.form_handler.fill_name_form(name):
             return None
-        
+
         # Handle email verification code
-        verification_code = self.captcha_handler.wait_for_email_verification_code(
-            dropmail, timeout=300
-        )
-        if not verification_code:
-            return None
-        
-        if not self.form_handler.fill_verification_code(verification_code):
+        if not self._handle_email_verification(dropmail):
             return None
-        
+
         # Fill password form
         used_password = self.form_handler.fill_password_form(password)
         if not used_password:
@@ -4,15 +4,39 @@ Responsible for handling image CAPTCHAs and email verification codes
 """
 
 import logging
+import threading
 import time
 import re
 from typing import Optional, Tuple
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 
 from .element_waiter import ElementWaiter
 from .optimized_selectors import get_selector
 
 
+# Common verification code patterns, ordered by specificity and compiled once at import
+_VERIFICATION_CODE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'verification code[:\s]+([A-Z0-9]{6})',  # verification code: XXXXXX
+        r'code[:\s]+([A-Z0-9]{6})',  # code: XXXXXX
+        r'([A-Z0-9]{6})',  # 6-digit uppercase alphanumeric
+        r'(\d{6})',  # 6-digit number
+        r'([A-Z]{6})',  # 6-digit uppercase letters
+    )
+]
+
+# HTML tag pattern for stripping markup from email bodies before code extraction
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# Keywords that usually appear near the verification code in the email body
+_CODE_KEYWORDS = ('verification', 'verify', 'code')
+
+# Window size (characters) around a keyword hit to scan for the code
+_CODE_WINDOW = 200
+
+
 class CaptchaHandler:
     """CAPTCHA Handler"""
     
@@ -139,42 +163,52 @@ class CaptchaHandler:
         Returns:
             Extracted verification code, None if not found
         """
-        # Common verification code patterns
-        patterns = [
-            r'verification code[:\s]+([A-Z0-9]{6})',  # verification code: XXXXXX
-            r'code[:\s]+([A-Z0-9]{6})',  # code: XXXXXX
-            r'([A-Z0-9]{6})',  # 6-digit uppercase alphanumeric
-            r'(\d{6})',  # 6-digit number
-            r'([A-Z]{6})',  # 6-digit uppercase letters
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, email_content, re.IGNORECASE)
+        # Strip HTML tags so class names / CSS tokens can't false-match the generic patterns
+        if '<' in email_content:
+            email_content = _HTML_TAG_PATTERN.sub(' ', email_content)
+
+        # Narrow the search to a small window around a keyword hit when possible,
+        # falling back to the full content if no keyword is found
+        search_content = email_content
+        lowered = email_content.lower()
+        for keyword in _CODE_KEYWORDS:
+            index = lowered.find(keyword)
+            if index != -1:
+                start = max(0, index - _CODE_WINDOW)
+                search_content = email_content[start:index + _CODE_WINDOW]
+                break
+
+        for pattern in _VERIFICATION_CODE_PATTERNS:
+            match = pattern.search(search_content)
             if match:
                 code = match.group(1)
                 self.logger.info(f"Verification code extracted from email: {code}")
                 return code
-        
+
         self.logger.warning("Unable to extract verification code from email")
         return None
     
-    def wait_for_email_verification_code(self, dropmail=None, timeout: int = 300) -> Optional[str]:
+    def wait_for_email_verification_code(self, dropmail=None, timeout: int = 300,
+                                         driver_free: Optional[threading.Event] = None) -> Optional[str]:
         """
         Wait for email verification code
-        
+
         Args:
             dropmail: DropMail instance, if provided will automatically get verification code
             timeout: Timeout duration (seconds)
-            
+            driver_free: Event that is set once no other thread is using the
+                driver; resend clicks are skipped while it is unset
+
         Returns:
             Verification code, None if failed to get
         """
         if dropmail:
-            return self._auto_get_verification_code(dropmail, timeout)
+            return self._auto_get_verification_code(dropmail, timeout, driver_free)
         else:
             return self._manual_get_verification_code()
-    
-    def _auto_get_verification_code(self, dropmail, timeout: int) -> Optional[str]:
+
+    def _auto_get_verification_code(self, dropmail, timeout: int,
+                                    driver_free: Optional[threading.Event] = None) -> Optional[str]:
         """Automatically get verification code from email with optimized retry logic"""
         self.logger.info("Waiting for email verification code...")
         
@@ -200,6 +234,13 @@ class CaptchaHandler:
                 else:
                     # No email received, try resend if not last attempt
                     if attempt < max_attempts - 1:
+                        # The resend click drives the browser; when another
+                        # thread still owns the driver, skip this round and
+                        # just keep waiting (drivers are not thread-safe)
+                        if driver_free is not None and not driver_free.is_set():
+                            self.logger.info(f"No email after {wait_time}s, "
+                                             "driver busy, skipping resend")
+                            continue
                         self.logger.info(f"No email after {wait_time}s, trying to resend...")
                         if self._resend_verification_code():
                             self.logger.info("Verification code resent")
@@ -240,25 +281,26 @@ class CaptchaHandler:
                         break
                     else:
                         self.logger.debug(f"Selector {selector} found no elements")
-                except Exception as e:
+                except WebDriverException as e:
                     self.logger.debug(f"Selector {selector} error: {e}")
                     continue
             
             if not resend_button:
                 self.logger.warning("Resend verification code button not found")
                 # Print current page button info for debugging
+                # Single JS call batches all attribute reads instead of one round-trip per attribute
                 try:
-                    buttons = self.driver.find_elements("css selector", "button")
-                    self.logger.debug(f"Found {len(buttons)} buttons on page")
-                    for i, btn in enumerate(buttons[:5]):  # Only show first 5
-                        try:
-                            test_id = btn.get_attribute("data-testid") or "none"
-                            text = btn.text or "no text"
-                            self.logger.debug(f"Button {i+1}: data-testid='{test_id}', text='{text}'")
-                        except:
-                            pass
-                except:
-                    pass
+                    button_infos = self.driver.execute_script(
+                        "return Array.from(document.querySelectorAll('button')).slice(0, 5)"
+                        ".map(b => ({testId: b.getAttribute('data-testid'), text: b.innerText}));"
+                    )
+                    self.logger.debug(f"Found {len(button_infos)} buttons on page")
+                    for i, info in enumerate(button_infos, 1):
+                        test_id = info.get("testId") or "none"
+                        text = info.get("text") or "no text"
+                        self.logger.debug(f"Button {i}: data-testid='{test_id}', text='{text}'")
+                except WebDriverException as e:
+                    self.logger.debug(f"Failed to collect button debug info: {e}")
                 return False
             
             # Check if button is clickable
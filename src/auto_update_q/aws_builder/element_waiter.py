@@ -5,12 +5,13 @@ Responsible for waiting and finding page elements
 
 import logging
 import time
-from typing import Optional, List, Any
+from collections import OrderedDict
+from typing import Optional, List, Any, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException
 
 from .config import DEFAULT_TIMEOUT, DEFAULT_RETRY_ROUNDS, DEFAULT_RETRY_TIMEOUT
 from .optimized_selectors import get_selector, get_timeout, get_retry_config
@@ -18,17 +19,97 @@ from .optimized_selectors import get_selector, get_timeout, get_retry_config
 
 class ElementWaiter:
     """Element Waiter"""
-    
+
+    # Bounds for the selector-result cache
+    _CACHE_MAX_ENTRIES = 64
+    _CACHE_WINDOW_SECONDS = 0.5
+
     def __init__(self, driver: webdriver.Edge, logger: Optional[logging.Logger] = None):
         """
         Initialize element waiter
-        
+
         Args:
             driver: Browser driver
             logger: Logger instance
         """
         self.driver = driver
         self.logger = logger or logging.getLogger(__name__)
+
+        # LRU cache of selector lookups, valid for the current page fingerprint only
+        self._selector_cache: OrderedDict = OrderedDict()
+        self._cache_fingerprint: Optional[Tuple[str, int]] = None
+
+    def cached_any_element(self, selectors: List[str], timeout: int = 10) -> Optional[Any]:
+        """
+        wait_for_any_element with a short-lived per-page result cache
+
+        Repeated probes for the same selector set on the same page state
+        (same URL, within a 0.5s window) return the cached result instead
+        of re-polling. Useful for status probes that run in tight loops.
+
+        Args:
+            selectors: List of selectors
+            timeout: Timeout duration (used only on cache miss)
+
+        Returns:
+            First found element or None
+        """
+        fingerprint = self._page_fingerprint()
+        if fingerprint != self._cache_fingerprint:
+            self._selector_cache.clear()
+            self._cache_fingerprint = fingerprint
+
+        key = tuple(selectors)
+        if key in self._selector_cache:
+            element = self._selector_cache[key]
+            try:
+                if element is not None:
+                    element.is_displayed()  # Probe for staleness
+                self._selector_cache.move_to_end(key)
+                return element
+            except StaleElementReferenceException:
+                del self._selector_cache[key]
+
+        element = self.wait_for_any_element(selectors, timeout)
+        self._selector_cache[key] = element
+        if len(self._selector_cache) > self._CACHE_MAX_ENTRIES:
+            self._selector_cache.popitem(last=False)
+        return element
+
+    def any_present_now(self, selectors: List[str]) -> Optional[Any]:
+        """
+        Check right now whether any element matching the selectors is visible
+
+        Unlike wait_for_any_element this does not poll: it issues a single
+        find_elements call on the comma-joined selector union and returns
+        the first visible match, so a negative answer costs one round-trip
+        instead of a full timeout.
+
+        Args:
+            selectors: List of CSS selectors
+
+        Returns:
+            First visible matching element or None
+        """
+        # jQuery-style :contains() selectors are not valid CSS and would
+        # invalidate the whole union query
+        css_selectors = [s for s in selectors if ":contains(" not in s]
+        if not css_selectors:
+            return None
+
+        try:
+            elements = self.driver.find_elements(By.CSS_SELECTOR, ", ".join(css_selectors))
+            return next((e for e in elements if e.is_displayed()), None)
+        except (NoSuchElementException, StaleElementReferenceException):
+            return None
+
+    def _page_fingerprint(self) -> Tuple[str, int]:
+        """Cheap page-state fingerprint: current URL plus a 0.5s time bucket"""
+        try:
+            url = self.driver.current_url
+        except Exception:
+            url = ""
+        return (url, int(time.monotonic() / self._CACHE_WINDOW_SECONDS))
     
     def wait_for_element_with_retry(self, selectors: List[str], element_name: str, 
                                   max_rounds: Optional[int] = None, 
@@ -99,9 +180,8 @@ class ElementWaiter:
                     return element
             
             if round_num < max_rounds:
-                wait_time = 2
-                self.logger.debug(f"Round {round_num} failed, waiting {wait_time} seconds before retry...")
-                time.sleep(wait_time)
+                self.logger.debug(f"Round {round_num} failed, waiting for DOM to settle before retry...")
+                self._wait_for_dom_settle(max_wait=2.0)
         
         self.logger.warning(f"✗ All attempts failed, clickable element not found: {element_name}")
         return None
@@ -147,7 +227,7 @@ class ElementWaiter:
             except StaleElementReferenceException:
                 self.logger.warning("Element reference stale, need to refind")
                 return False
-            except Exception as e:
+            except WebDriverException as e:
                 self.logger.warning(f"Error checking element interactive state: {e}")
                 time.sleep(0.1)
         
@@ -181,7 +261,7 @@ class ElementWaiter:
                 
                 time.sleep(0.2)
                 
-            except Exception as e:
+            except WebDriverException as e:
                 self.logger.warning(f"Error checking page change: {e}")
                 time.sleep(0.2)
         
@@ -222,7 +302,7 @@ class ElementWaiter:
                 
                 time.sleep(0.5)
                 
-            except Exception as e:
+            except WebDriverException as e:
                 self.logger.warning(f"Error checking redirect: {e}")
                 time.sleep(0.5)
         
@@ -267,9 +347,25 @@ class ElementWaiter:
         except (TimeoutException, NoSuchElementException):
             return None
     
+    def _wait_for_dom_settle(self, max_wait: float = 2.0) -> None:
+        """
+        Wait briefly for the DOM to settle between retry rounds
+
+        Exits as soon as the document reports readyState complete instead
+        of always sleeping the full duration.
+
+        Args:
+            max_wait: Upper bound on the wait (seconds)
+        """
+        deadline = time.monotonic() + max_wait
+        while time.monotonic() < deadline:
+            if self._check_page_loading_complete():
+                return
+            time.sleep(0.1)
+
     def _check_page_loading_complete(self) -> bool:
         """Check if page loading is complete"""
         try:
             return self.driver.execute_script("return document.readyState") == "complete"
-        except Exception:
+        except WebDriverException:
             return False
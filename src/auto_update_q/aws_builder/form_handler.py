@@ -149,31 +149,33 @@ class FormHandler:
             self.logger.error(f"Error filling password: {e}")
             return None
     
-    def fill_verification_code(self, code: str) -> bool:
+    def fill_verification_code(self, code: str, code_input=None) -> bool:
         """
         Fill verification code
-        
+
         Args:
             code: Verification code
-            
+            code_input: Already-located input element (optional, skips the lookup)
+
         Returns:
             Whether filling was successful
         """
         self.logger.info("Starting to fill verification code...")
-        
-        # Wait for verification code input field
-        code_selectors = get_selector("verification_code_input")
-        code_input = self.element_waiter.wait_for_element_with_retry(
-            code_selectors, "verification code input field"
-        )
-        
+
+        # Wait for verification code input field unless the caller already found it
+        if code_input is None:
+            code_selectors = get_selector("verification_code_input")
+            code_input = self.element_waiter.wait_for_element_with_retry(
+                code_selectors, "verification code input field"
+            )
+
         if not code_input:
             self.logger.error("Verification code input field not found")
             return False
         
         # Fill verification code
         try:
-            self._fill_input_field(code_input, code, "verification code")
+            self._fill_input_field_js(code_input, code, "verification code")
             
             # Click verify button
             return self._click_next_button("verify_button", "verify button")
@@ -232,6 +234,38 @@ class FormHandler:
         element.clear()
         element.send_keys(value)
         self.logger.info(f"Filled {field_name}: {value if field_name != 'password' else '***'}")
+
+    def _fill_input_field_js(self, element, value: str, field_name: str) -> None:
+        """
+        Fill input field via JavaScript in a single round-trip
+
+        Sets the value through the native setter (so controlled React inputs
+        pick it up) and dispatches input/change events, instead of the
+        clear() + per-character send_keys() sequence.
+
+        Args:
+            element: Input element
+            value: Value to fill
+            field_name: Field name (for logging)
+        """
+        actual = self.driver.execute_script(
+            "arguments[0].scrollIntoView(true);"
+            "const setter = Object.getOwnPropertyDescriptor("
+            "    HTMLInputElement.prototype, 'value').set;"
+            "setter.call(arguments[0], arguments[1]);"
+            "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+            "arguments[0].dispatchEvent(new Event('change', {bubbles: true}));"
+            "return arguments[0].value;",
+            element, value
+        )
+
+        if actual != value:
+            # Fall back to the regular fill path if the page rejected the JS set
+            self.logger.warning(f"JS fill for {field_name} returned '{actual}', falling back to send_keys")
+            self._fill_input_field(element, value, field_name)
+            return
+
+        self.logger.info(f"Filled {field_name}: {value if field_name != 'password' else '***'}")
     
     def _click_next_button(self, button_key: str, button_name: str) -> bool:
         """
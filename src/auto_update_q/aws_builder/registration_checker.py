@@ -4,14 +4,34 @@ Responsible for checking AWS Builder ID registration status and results
 """
 
 import logging
+import re
 import time
 from typing import Optional, Dict, Any
 from selenium import webdriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from .element_waiter import ElementWaiter
 from .optimized_selectors import get_selector
 
 
+# Builder ID embedded in a success URL, e.g. /builder/AbCd1234...
+_BUILDER_ID_URL_PATTERN = re.compile(r'/builder/([A-Za-z0-9_-]{8,})')
+
+# URL substrings that indicate a successful registration
+_SUCCESS_URL_PATTERNS = (
+    "dashboard",
+    "console",
+    "welcome",
+    "success",
+    "complete",
+    "view.awsapps.com",
+)
+
+# URL substrings on which dashboard elements can exist at all
+_DASHBOARD_URL_PATTERNS = ("dashboard", "console", "view.awsapps.com")
+
+
 class RegistrationChecker:
     """Registration Status Checker"""
     
@@ -43,34 +63,30 @@ class RegistrationChecker:
         
         current_url = self.driver.current_url
         self.logger.info(f"Current URL: {current_url}")
-        
-        # Check success indicators
-        success_indicators = [
-            self._check_success_url(),
-            self._check_success_elements(),
-            self._check_dashboard_access(),
-        ]
-        
-        # Check failure indicators
-        failure_indicators = [
-            self._check_error_messages(),
-            self._check_registration_form_still_present(),
-        ]
-        
-        success_count = sum(success_indicators)
-        failure_count = sum(failure_indicators)
-        
-        self.logger.info(f"Success indicators: {success_count}/3, Failure indicators: {failure_count}/2")
-        
-        if success_count >= 2:
+
+        # Cheap URL check first - a success URL is decisive, no element probes needed
+        if self._check_success_url(current_url):
             self.logger.info("✓ Registration successful")
             return True
-        elif failure_count >= 1:
+
+        # A visible error message is decisive, skip the expensive success probes
+        if self._check_error_messages():
             self.logger.warning("✗ Registration failed")
             return False
-        else:
-            self.logger.info("Registration status unclear, may need more time")
+
+        # Only now run the expensive element probes, merged into one union query
+        success_hit, dashboard_hit = self._probe_success_and_dashboard(current_url)
+
+        if success_hit and dashboard_hit:
+            self.logger.info("✓ Registration successful")
+            return True
+
+        if self._check_registration_form_still_present(current_url):
+            self.logger.warning("✗ Registration failed")
             return False
+
+        self.logger.info("Registration status unclear, may need more time")
+        return False
     
     def get_registration_info(self) -> Dict[str, Any]:
         """
@@ -79,14 +95,15 @@ class RegistrationChecker:
         Returns:
             Dictionary containing registration information
         """
+        current_url = self.driver.current_url
         info = {
-            "current_url": self.driver.current_url,
+            "current_url": current_url,
             "page_title": self._get_page_title(),
-            "builder_id": self._extract_builder_id(),
+            "builder_id": self._extract_builder_id(current_url),
             "success": self.check_registration_success(),
             "timestamp": time.time()
         }
-        
+
         return info
     
     def wait_for_registration_completion(self, timeout: int = 60) -> bool:
@@ -100,80 +117,127 @@ class RegistrationChecker:
             Whether registration completed successfully
         """
         self.logger.info(f"Waiting for registration completion, timeout: {timeout} seconds")
-        
-        start_time = time.time()
-        last_url = self.driver.current_url
-        check_interval = 2
-        
-        while time.time() - start_time < timeout:
-            try:
-                current_url = self.driver.current_url
-                
-                # Check URL changes
-                if current_url != last_url:
-                    self.logger.info(f"URL changed: {current_url}")
-                    last_url = current_url
-                
-                # Check registration status
-                if self.check_registration_success():
-                    return True
-                
-                # Check for errors
-                if self._check_error_messages():
-                    self.logger.error("Error message detected, registration failed")
-                    return False
-                
-                # Dynamically adjust check interval
-                remaining_time = timeout - (time.time() - start_time)
-                if remaining_time < 10:
-                    check_interval = 0.5  # More frequent checks in last 10 seconds
-                
-                time.sleep(check_interval)
-                
-            except Exception as e:
-                self.logger.warning(f"Error while waiting for registration completion: {e}")
-                time.sleep(check_interval)
-        
-        self.logger.warning("Registration completion wait timeout")
-        return False
+
+        try:
+            outcome = WebDriverWait(
+                self.driver, timeout, poll_frequency=0.5,
+                ignored_exceptions=(WebDriverException,)
+            ).until(lambda _: self._registration_outcome())
+            return outcome == "success"
+        except TimeoutException:
+            self.logger.warning("Registration completion wait timeout")
+            return False
+
+    def _registration_outcome(self) -> Optional[str]:
+        """
+        Determine terminal registration state for polling
+
+        Returns:
+            "success" or "failure" when decided, None to keep polling
+        """
+        if self.check_registration_success():
+            return "success"
+
+        if self._check_error_messages():
+            self.logger.error("Error message detected, registration failed")
+            return "failure"
+
+        return None
     
-    def _check_success_url(self) -> bool:
+    def _check_success_url(self, current_url: Optional[str] = None) -> bool:
         """Check success URL patterns"""
-        current_url = self.driver.current_url.lower()
-        success_patterns = [
-            "dashboard",
-            "console",
-            "welcome",
-            "success",
-            "complete",
-            "view.awsapps.com"
-        ]
-        
-        for pattern in success_patterns:
-            if pattern in current_url:
-                self.logger.info(f"✓ Success URL pattern detected: {pattern}")
-                return True
-        
+        # Reuse the caller's URL when available - each read is a WebDriver round-trip
+        current_url = (current_url or self.driver.current_url).lower()
+
+        pattern = next((p for p in _SUCCESS_URL_PATTERNS if p in current_url), None)
+        if pattern:
+            self.logger.info(f"✓ Success URL pattern detected: {pattern}")
+            return True
+
         return False
     
+    def _probe_success_and_dashboard(self, current_url: str) -> tuple:
+        """
+        Probe success-indicator and dashboard elements with a single union query
+
+        Instead of two serial waits of up to 3s each, wait once on the merged
+        selector set, then classify the hit and check the other set without
+        polling (the page is already rendered by that point).
+
+        Args:
+            current_url: Current page URL
+
+        Returns:
+            (success_hit, dashboard_hit) tuple
+        """
+        success_selectors = get_selector("success_indicators")
+
+        # Dashboard elements are only worth probing on dashboard-like URLs
+        url = current_url.lower()
+        if any(pattern in url for pattern in _DASHBOARD_URL_PATTERNS):
+            dashboard_selectors = get_selector("dashboard_elements")
+        else:
+            dashboard_selectors = []
+
+        element = self.element_waiter.cached_any_element(
+            success_selectors + dashboard_selectors, timeout=3
+        )
+        if not element or not element.is_displayed():
+            return False, False
+
+        matched_success = self._element_matches_any(element, success_selectors)
+        if matched_success:
+            self.logger.info("✓ Success element detected")
+            dashboard_hit = bool(
+                dashboard_selectors
+                and self.element_waiter.any_present_now(dashboard_selectors)
+            )
+            if dashboard_hit:
+                self.logger.info("✓ Dashboard element detected")
+            return True, dashboard_hit
+
+        self.logger.info("✓ Dashboard element detected")
+        success_hit = bool(self.element_waiter.any_present_now(success_selectors))
+        if success_hit:
+            self.logger.info("✓ Success element detected")
+        return success_hit, True
+
+    def _element_matches_any(self, element, selectors) -> bool:
+        """Check via one JS call whether the element matches any of the selectors"""
+        css_selectors = [s for s in selectors if ":contains(" not in s]
+        if not css_selectors:
+            return False
+        try:
+            return bool(self.driver.execute_script(
+                "return arguments[0].matches(arguments[1]);",
+                element, ", ".join(css_selectors)
+            ))
+        except WebDriverException:
+            return False
+
     def _check_success_elements(self) -> bool:
         """Check success page elements"""
         success_selectors = get_selector("success_indicators")
         
         # Use quick check, don't wait too long
-        element = self.element_waiter.wait_for_any_element(success_selectors, timeout=3)
+        element = self.element_waiter.cached_any_element(success_selectors, timeout=3)
         if element and element.is_displayed():
             self.logger.info("✓ Success element detected")
             return True
         
         return False
     
-    def _check_dashboard_access(self) -> bool:
+    def _check_dashboard_access(self, current_url: Optional[str] = None) -> bool:
         """Check if dashboard is accessible"""
+        # No dashboard to find unless the URL already looks like one
+        url = (current_url or self.driver.current_url).lower()
+        if not any(pattern in url for pattern in _DASHBOARD_URL_PATTERNS):
+            return False
+
         dashboard_selectors = get_selector("dashboard_elements")
-        
+
         # Use quick check
-        element = self.element_waiter.wait_for_any_element(dashboard_selectors, timeout=3)
+        element = self.element_waiter.cached_any_element(dashboard_selectors, timeout=3)
         if element and element.is_displayed():
             self.logger.info("✓ Dashboard element detected")
             return True
@@ -183,23 +247,28 @@ class RegistrationChecker:
     def _check_error_messages(self) -> bool:
         """Check error messages"""
         error_selectors = get_selector("error_messages")
-        
-        # Quick check for error messages
-        element = self.element_waiter.wait_for_any_element(error_selectors, timeout=1)
-        if element and element.is_displayed():
+
+        # Single non-polling presence check - no need to wait for an error to appear
+        element = self.element_waiter.any_present_now(error_selectors)
+        if element:
             error_text = element.text
             self.logger.warning(f"✗ Error message detected: {error_text}")
             return True
         
         return False
     
-    def _check_registration_form_still_present(self) -> bool:
+    def _check_registration_form_still_present(self, current_url: Optional[str] = None) -> bool:
         """Check if registration form still exists"""
+        # The form cannot still be present once the URL moved off the signup page
+        url = (current_url or self.driver.current_url).lower()
+        if "signup" not in url:
+            return False
+
         form_selectors = get_selector("registration_form")
-        
-        # Quick check if form is still there
-        element = self.element_waiter.wait_for_any_element(form_selectors, timeout=2)
-        if element and element.is_displayed():
+
+        # Single non-polling presence check - the form is either there or it isn't
+        element = self.element_waiter.any_present_now(form_selectors)
+        if element:
             self.logger.warning("✗ Registration form still present")
             return True
         
@@ -213,26 +282,33 @@ class RegistrationChecker:
             self.logger.warning(f"Failed to get page title: {e}")
             return None
     
-    def _extract_builder_id(self) -> Optional[str]:
+    def _extract_builder_id(self, current_url: Optional[str] = None) -> Optional[str]:
         """Extract Builder ID"""
+        current_url = current_url or self.driver.current_url
+
+        # Try to extract from URL first - no further round-trips needed on a hit
+        match = _BUILDER_ID_URL_PATTERN.search(current_url)
+        if match:
+            builder_id = match.group(1)
+            self.logger.info(f"Builder ID extracted from URL: {builder_id}")
+            return builder_id
+
+        # The display element can only exist on a success page
+        if not self._check_success_url(current_url):
+            return None
+
         try:
-            # Try to extract from URL
-            current_url = self.driver.current_url
-            if "builder" in current_url.lower():
-                # Specific extraction logic can be added here
-                pass
-            
-            # Try to extract from page elements
+            # Single-shot element lookup, no polling wait
             builder_id_selectors = get_selector("builder_id_display")
-            element = self.element_waiter.wait_for_any_element(builder_id_selectors, timeout=2)
+            element = self.element_waiter.any_present_now(builder_id_selectors)
             if element:
                 builder_id = element.text.strip()
                 if builder_id:
                     self.logger.info(f"Builder ID extracted: {builder_id}")
                     return builder_id
-            
+
             return None
-            
+
         except Exception as e:
             self.logger.warning(f"Failed to extract Builder ID: {e}")
             return None
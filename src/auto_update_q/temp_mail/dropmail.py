@@ -6,21 +6,58 @@ Supports Session persistence and recovery functionality
 """
 
 import json
+import random
+import secrets
 import time
-import uuid
 import os
 import logging
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
 
-@dataclass
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writers race as before
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def _json_loads(data):
+    '''Parse JSON bytes/str with orjson when available'''
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    '''Serialize to indented JSON bytes with orjson when available'''
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _json_dumps_line(obj) -> bytes:
+    '''Serialize to compact single-line JSON bytes (one journal entry)'''
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+@dataclass(slots=True)
 class SessionCache:
     """Session cache data class"""
     session_id: str
@@ -31,21 +68,39 @@ class SessionCache:
     last_accessed: str
     restore_keys: List[str]
     password: Optional[str] = None  # Add password field
-    
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return asdict(self)
+        # Explicit literal instead of asdict(), which deep-copies recursively
+        return {
+            "session_id": self.session_id,
+            "auth_token": self.auth_token,
+            "email_address": self.email_address,
+            "expires_at": self.expires_at,
+            "created_at": self.created_at,
+            "last_accessed": self.last_accessed,
+            "restore_keys": self.restore_keys,
+            "password": self.password,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SessionCache':
         """Create instance from dictionary"""
-        # Handle backward compatibility for existing cache files
-        if 'password' not in data:
-            data['password'] = None
-        return cls(**data)
+        # Positional construction skips the **kwargs unpacking path;
+        # .get() covers cache files written before the password field
+        return cls(
+            data["session_id"],
+            data["auth_token"],
+            data["email_address"],
+            data["expires_at"],
+            data["created_at"],
+            data["last_accessed"],
+            data["restore_keys"],
+            data.get("password"),
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Mail:
     """Email data class"""
     id: str
@@ -60,7 +115,7 @@ class Mail:
     raw: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Address:
     """Email address data class"""
     id: str
@@ -68,7 +123,7 @@ class Address:
     restore_key: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Session data class"""
     id: str
@@ -77,9 +132,226 @@ class Session:
     mails: List[Mail]
 
 
+# GraphQL queries hoisted to module level so polling loops don't rebuild
+# the string literals on every call
+_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+# (connect, read) timeout: fail fast on unreachable hosts without
+# cutting short slow-but-alive responses
+_TIMEOUT = (3.05, 30)
+
+_MAIL_FIELDS = """
+                        id,
+                        fromAddr,
+                        toAddr,
+                        headerSubject,
+                        text,
+                        html,
+                        receivedAt,
+                        rawSize,
+                        downloadUrl"""
+
+# raw is the full RFC 5322 source and can be huge; only fetched on request
+_MAIL_FIELDS_RAW = _MAIL_FIELDS + """,
+                        raw"""
+
+_Q_DOMAINS = """
+query {
+    domains {
+        id,
+        name,
+        availableVia
+    }
+}
+"""
+
+_Q_INTRODUCE_SESSION = """
+mutation {
+    introduceSession {
+        id,
+        expiresAt,
+        addresses {
+            id,
+            address,
+            restoreKey
+        }
+    }
+}
+"""
+
+_Q_INTRODUCE_SESSION_DOMAIN = """
+mutation($domainId: ID!) {
+    introduceSession(input: {withAddress: true, domainId: $domainId}) {
+        id,
+        expiresAt,
+        addresses {
+            id,
+            address,
+            restoreKey
+        }
+    }
+}
+"""
+
+_Q_INTRODUCE_ADDRESS = """
+mutation($sessionId: ID!) {
+    introduceAddress(input: {sessionId: $sessionId}) {
+        id,
+        address,
+        restoreKey
+    }
+}
+"""
+
+_Q_INTRODUCE_ADDRESS_DOMAIN = """
+mutation($sessionId: ID!, $domainId: ID!) {
+    introduceAddress(input: {sessionId: $sessionId, domainId: $domainId}) {
+        id,
+        address,
+        restoreKey
+    }
+}
+"""
+
+_Q_RESTORE_ADDRESS = """
+mutation($input: RestoreAddressInput!) {
+    restoreAddress(input: $input) {
+        id,
+        address,
+        restoreKey
+    }
+}
+"""
+
+_Q_GET_MAILS = f"""
+query($sessionId: ID!) {{
+    session(id: $sessionId) {{
+        expiresAt,
+        mails {{{_MAIL_FIELDS}
+        }}
+    }}
+}}
+"""
+
+_Q_GET_MAILS_RAW = f"""
+query($sessionId: ID!) {{
+    session(id: $sessionId) {{
+        expiresAt,
+        mails {{{_MAIL_FIELDS_RAW}
+        }}
+    }}
+}}
+"""
+
+_Q_GET_MAILS_AFTER = f"""
+query($sessionId: ID!, $mailId: ID!) {{
+    session(id: $sessionId) {{
+        expiresAt,
+        mailsAfterId(mailId: $mailId) {{{_MAIL_FIELDS}
+        }}
+    }}
+}}
+"""
+
+_Q_GET_MAILS_AFTER_RAW = f"""
+query($sessionId: ID!, $mailId: ID!) {{
+    session(id: $sessionId) {{
+        expiresAt,
+        mailsAfterId(mailId: $mailId) {{{_MAIL_FIELDS_RAW}
+        }}
+    }}
+}}
+"""
+
+_Q_MAIL_IDS = """
+query($sessionId: ID!) {
+    session(id: $sessionId) {
+        mails {
+            id
+        }
+    }
+}
+"""
+
+_Q_MAIL_IDS_AFTER = """
+query($sessionId: ID!, $mailId: ID!) {
+    session(id: $sessionId) {
+        mailsAfterId(mailId: $mailId) {
+            id
+        }
+    }
+}
+"""
+
+_Q_MAIL_RAW = """
+query($sessionId: ID!) {
+    session(id: $sessionId) {
+        mails {
+            id,
+            raw
+        }
+    }
+}
+"""
+
+_Q_SESSION_BRIEF = """
+query($sessionId: ID!) {
+    session(id: $sessionId) {
+        id,
+        expiresAt,
+        addresses {
+            id,
+            address,
+            restoreKey
+        }
+    }
+}
+"""
+
+_Q_EXPIRES_AT = """
+query($sessionId: ID!) {
+    session(id: $sessionId) {
+        expiresAt
+    }
+}
+"""
+
+_Q_SESSION_INFO = """
+query($sessionId: ID!) {
+    session(id: $sessionId) {
+        id,
+        expiresAt,
+        addresses {
+            id,
+            address,
+            restoreKey
+        },
+        mails {
+            id,
+            fromAddr,
+            toAddr,
+            headerSubject,
+            text,
+            html,
+            receivedAt,
+            rawSize,
+            downloadUrl
+        }
+    }
+}
+"""
+
+
 class DropMail:
     """DropMail temporary email class"""
-    
+
+    # Minimum seconds between persisted last-accessed updates
+    _LAST_ACCESSED_MIN_INTERVAL = 60.0
+
+    # How long the memoized domain list stays fresh (seconds)
+    _DOMAINS_TTL = 300.0
+
+
     def __init__(self, auth_token: Optional[str] = None, cache_file: Optional[str] = None):
         """
         Initialize DropMail instance
@@ -88,12 +360,25 @@ class DropMail:
             auth_token: Authentication token, automatically generated if not provided
             cache_file: Cache file path, defaults to .cache/dropmail_sessions.json
         """
-        self.auth_token = auth_token or self._generate_auth_token()
         self.base_url = "https://dropmail.me/api/graphql"
+        self.auth_token = auth_token or self._generate_auth_token()
         self.session_id: Optional[str] = None
         self.addresses: List[Address] = []
-        self.logger = logging.getLogger("dropmail")
-        
+        self.logger = logger
+
+        # Pooled HTTP session with keep-alive: avoids a fresh TCP+TLS
+        # handshake on every GraphQL call in polling loops
+        self._http = requests.Session()
+        self._http.headers.update(_HEADERS)
+        self._http.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        ))
         # Set cache file path
         if cache_file:
             self.cache_file = Path(cache_file)
@@ -102,10 +387,50 @@ class DropMail:
         
         # Ensure cache directory exists
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-        
+
+        # In-memory view of the cache file, refreshed only when the file
+        # changes on disk (mtime check) and kept current by _flush_cache
+        self._cache_mem: Optional[Dict[str, Dict[str, Any]]] = None
+        self._cache_mtime: float = 0.0
+
+        # Journal bookkeeping: whether the file is in append-only NDJSON
+        # format and how many op lines it currently holds
+        self._cache_ndjson: bool = True
+        self._cache_lines: int = 0
+
+        # Expiration time of the current session, captured from the
+        # introduceSession response so save paths need no extra query
+        self._current_expires_at: Optional[str] = None
+
+        # Last time the last-accessed timestamp was persisted (monotonic)
+        self._last_accessed_write: float = 0.0
+
+        # Memoized domain list: (fetch time, domains)
+        self._domains_cache: Optional[tuple] = None
+
+        # Content key of the last saved session record, for skipping
+        # byte-identical re-saves on registration retries
+        self._last_saved_key: Optional[tuple] = None
+        
+    @property
+    def auth_token(self) -> str:
+        """Authentication token; keeps the endpoint URL in sync on change"""
+        return self._auth_token
+
+    @auth_token.setter
+    def auth_token(self, value: str) -> None:
+        self._auth_token = value
+        self._endpoint = f"{self.base_url}/{value}"
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections held by this instance"""
+        self._http.close()
+
     def _generate_auth_token(self) -> str:
         """Generate authentication token"""
-        return str(uuid.uuid4()).replace('-', '')[:16]
+        # 16 hex chars straight from the CSPRNG, without the UUID
+        # format-strip-slice detour
+        return secrets.token_hex(8)
     
     def save_successful_session(self, password: Optional[str] = None) -> bool:
         """
@@ -121,37 +446,45 @@ class DropMail:
             return False
         
         try:
-            # Read existing cache
-            sessions = self._load_cache()
-            
-            # Create cache data
+            # Create cache data (one timestamp serves both fields)
+            now_iso = datetime.now().isoformat()
             session_cache = SessionCache(
                 session_id=self.session_id,
                 auth_token=self.auth_token,
                 email_address=self.addresses[0].address if self.addresses else "",
                 expires_at="",  # Will be updated during validation
-                created_at=datetime.now().isoformat(),
-                last_accessed=datetime.now().isoformat(),
+                created_at=now_iso,
+                last_accessed=now_iso,
                 restore_keys=[addr.restore_key for addr in self.addresses],
                 password=password
             )
-            
-            # Update expiration time
-            session_info = self.get_session_info()
-            if session_info:
-                session_cache.expires_at = session_info.expires_at
-            
-            # Save to cache
-            sessions[self.session_id] = session_cache.to_dict()
-            
-            # Write to file
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(sessions, f, indent=2, ensure_ascii=False)
-            
+
+            # Update expiration time (known from create_session, otherwise
+            # fetched with a minimal single-field query)
+            expires_at = self._current_expires_at or self._fetch_expires_at()
+            if expires_at:
+                session_cache.expires_at = expires_at
+
+            # Idempotent retries write nothing: skip the journal append
+            # when the record content hasn't changed since the last save
+            save_key = (
+                self.session_id,
+                self.auth_token,
+                tuple(session_cache.restore_keys),
+                session_cache.expires_at,
+                password,
+            )
+            if save_key == self._last_saved_key:
+                return True
+
+            # Append to cache journal
+            self._append_cache_op("upsert", self.session_id, session_cache.to_dict())
+            self._last_saved_key = save_key
+
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to save session: {e}")
+            self.logger.error("Failed to save session: %s", e)
             return False
     
     def update_last_accessed(self) -> bool:
@@ -167,71 +500,177 @@ class DropMail:
         try:
             sessions = self._load_cache()
             if self.session_id in sessions:
-                sessions[self.session_id]['last_accessed'] = datetime.now().isoformat()
-                with open(self.cache_file, 'w', encoding='utf-8') as f:
-                    json.dump(sessions, f, indent=2, ensure_ascii=False)
+                data = dict(sessions[self.session_id])
+                data['last_accessed'] = datetime.now().isoformat()
+                self._append_cache_op("upsert", self.session_id, data)
                 return True
         except Exception as e:
-            self.logger.error(f"Failed to update last accessed time: {e}")
+            self.logger.error("Failed to update last accessed time: %s", e)
         return False
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
         """
-        Save current session to cache file
+        Load cache file, reusing the in-memory copy when the file is unchanged
         
         Returns:
-            Whether save was successful
+            Cache data dictionary
         """
-        if not self.session_id or not self.addresses:
-            return False
-        
         try:
-            # Read existing cache
-            sessions = self._load_cache()
-            
-            # Create cache data
-            session_cache = SessionCache(
-                session_id=self.session_id,
-                auth_token=self.auth_token,
-                email_address=self.addresses[0].address if self.addresses else "",
-                expires_at="",  # Will be updated during validation
-                created_at=datetime.now().isoformat(),
-                last_accessed=datetime.now().isoformat(),
-                restore_keys=[addr.restore_key for addr in self.addresses]
-            )
-            
-            # Update expiration time
-            session_info = self.get_session_info()
-            if session_info:
-                session_cache.expires_at = session_info.expires_at
-            
-            # Save to cache
-            sessions[self.session_id] = session_cache.to_dict()
-            
-            # Write to file
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(sessions, f, indent=2, ensure_ascii=False)
-            
-            return True
-            
+            mtime = os.stat(self.cache_file).st_mtime
+        except OSError:
+            self._cache_mem = {}
+            self._cache_mtime = 0.0
+            self._cache_ndjson = True
+            self._cache_lines = 0
+            return self._cache_mem
+
+        if self._cache_mem is not None and mtime == self._cache_mtime:
+            return self._cache_mem
+
+        try:
+            with open(self.cache_file, 'rb') as f:
+                self._cache_mem = self._parse_cache_bytes(f.read())
+            self._cache_mtime = mtime
         except Exception as e:
-            self.logger.error(f"Failed to save session: {e}")
-            return False
-    
-    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+            self.logger.error("Failed to load cache file: %s", e)
+            self._cache_mem = {}
+        return self._cache_mem
+
+    def _parse_cache_bytes(self, raw: bytes) -> Dict[str, Dict[str, Any]]:
         """
-        Load cache file
-        
+        Parse cache file content, accepting both formats
+
+        Either an NDJSON journal of upsert/delete ops (current format) or a
+        single JSON document mapping session_id to data (legacy format).
+
+        Args:
+            raw: Raw cache file bytes
+
         Returns:
-            Cache data dictionary
+            Folded sessions dictionary
         """
-        if not self.cache_file.exists():
+        if not raw.strip():
+            self._cache_ndjson = True
+            self._cache_lines = 0
             return {}
-        
+
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.error(f"Failed to load cache file: {e}")
-            return {}
+            data = _json_loads(raw)
+        except Exception:
+            data = None
+
+        if isinstance(data, dict) and data.get("op") not in ("upsert", "delete"):
+            # Legacy single-document mapping: compact on the next write
+            self._cache_ndjson = False
+            self._cache_lines = 0
+            return data
+
+        # NDJSON journal: fold ops line by line, last op per id wins
+        sessions: Dict[str, Dict[str, Any]] = {}
+        line_count = 0
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            line_count += 1
+            try:
+                entry = _json_loads(line)
+            except Exception as e:
+                self.logger.error("Skipping corrupt cache journal line: %s", e)
+                continue
+            if entry.get("op") == "delete":
+                sessions.pop(entry.get("id"), None)
+            else:
+                sessions[entry["id"]] = entry["data"]
+
+        self._cache_ndjson = True
+        self._cache_lines = line_count
+        return sessions
+
+    def _append_cache_op(self, op: str, session_id: str,
+                         data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Apply a single-session mutation and append it to the cache journal
+
+        Appending one op line replaces the previous full-file rewrite for
+        per-session updates. The journal is compacted when it grows past
+        4x the number of live sessions.
+
+        Args:
+            op: "upsert" or "delete"
+            session_id: Session ID the op applies to
+            data: Session data for upsert ops
+        """
+        sessions = self._load_cache()
+        if op == "upsert":
+            sessions[session_id] = data
+        else:
+            sessions.pop(session_id, None)
+
+        if not self._cache_ndjson:
+            # Legacy-format file: rewrite once to migrate to the journal
+            self._flush_cache(sessions)
+            return
+
+        entry: Dict[str, Any] = {"op": op, "id": session_id}
+        if data is not None:
+            entry["data"] = data
+
+        with self._cache_lock():
+            with open(self.cache_file, 'ab') as f:
+                f.write(_json_dumps_line(entry) + b"\n")
+        self._cache_lines += 1
+        self._cache_mem = sessions
+        try:
+            self._cache_mtime = os.stat(self.cache_file).st_mtime
+        except OSError:
+            self._cache_mtime = 0.0
+
+        if self._cache_lines > 4 * max(len(sessions), 1):
+            self._flush_cache(sessions)
+
+    @contextmanager
+    def _cache_lock(self):
+        """
+        Serialize concurrent cache writers with an advisory file lock
+
+        No-op on platforms without fcntl. Durability (fsync) is deliberately
+        not requested - this is only a cache.
+        """
+        if fcntl is None:
+            yield
+            return
+
+        lock_path = self.cache_file.with_suffix(self.cache_file.suffix + '.lock')
+        with open(lock_path, 'wb') as lock_fd:
+            fcntl.flock(lock_fd.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_fd.fileno(), fcntl.LOCK_UN)
+
+    def _flush_cache(self, sessions: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Compact and persist the full sessions dict, refreshing the memo
+
+        Writes to a temp file and renames it into place so readers never
+        see a truncated half-written cache.
+
+        Args:
+            sessions: Full sessions cache dictionary
+        """
+        tmp_path = self.cache_file.with_suffix(self.cache_file.suffix + '.tmp')
+        with self._cache_lock():
+            with open(tmp_path, 'wb') as f:
+                for session_id, data in sessions.items():
+                    f.write(_json_dumps_line({"op": "upsert", "id": session_id, "data": data}) + b"\n")
+            os.replace(tmp_path, self.cache_file)
+        self._cache_mem = sessions
+        self._cache_ndjson = True
+        self._cache_lines = len(sessions)
+        try:
+            self._cache_mtime = os.stat(self.cache_file).st_mtime
+        except OSError:
+            self._cache_mtime = 0.0
     
     def list_cached_sessions(self) -> List[SessionCache]:
         """
@@ -247,13 +686,33 @@ class DropMail:
             try:
                 sessions.append(SessionCache.from_dict(session_data))
             except Exception as e:
-                self.logger.error(f"Failed to parse session data: {e}")
+                self.logger.error("Failed to parse session data: %s", e)
                 continue
         
         # Sort by creation time
         sessions.sort(key=lambda x: x.created_at, reverse=True)
         return sessions
-    
+
+    @staticmethod
+    def _is_expired(expires_at: str) -> bool:
+        """
+        Best-effort local check whether an ISO expiry time is in the past
+
+        Args:
+            expires_at: ISO-format expiry timestamp (may be empty)
+
+        Returns:
+            True only when the timestamp parses and is clearly past
+        """
+        if not expires_at:
+            return False
+        try:
+            expires_dt = datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
+        except ValueError:
+            return False
+        now = datetime.now(expires_dt.tzinfo) if expires_dt.tzinfo else datetime.now()
+        return expires_dt < now
+
     def restore_session(self, session_id: str) -> bool:
         """
         Restore specified session (including expired ones using restore keys)
@@ -267,7 +726,7 @@ class DropMail:
         sessions_data = self._load_cache()
         
         if session_id not in sessions_data:
-            self.logger.error(f"Session {session_id} not found")
+            self.logger.error("Session %s not found", session_id)
             return False
         
         try:
@@ -277,36 +736,49 @@ class DropMail:
             self.auth_token = session_cache.auth_token
             self.session_id = session_id
             
-            # First try to verify if session is still valid
-            if self._verify_session():
+            # First try to verify if session is still valid; the brief query
+            # already returns the addresses, so no follow-up query is needed.
+            # Skip the round-trip entirely when the cached expiry is already
+            # past according to the local clock.
+            if self._is_expired(session_cache.expires_at):
+                session_brief = None
+            else:
+                session_brief = self._fetch_session_brief()
+            if session_brief:
                 # Session is still valid, restore normally
-                session_info = self.get_session_info()
-                if session_info:
-                    self.addresses = session_info.addresses
-                    self.logger.info(f"Successfully restored active Session: {session_id}")
-                    self.logger.info(f"Email address: {session_cache.email_address}")
-                    return True
+                self.addresses = [
+                    Address(
+                        id=addr_data["id"],
+                        address=addr_data["address"],
+                        restore_key=addr_data.get("restoreKey", "")
+                    )
+                    for addr_data in session_brief["addresses"]
+                ]
+                self._current_expires_at = session_brief["expiresAt"]
+                self.logger.info("Successfully restored active Session: %s", session_id)
+                self.logger.info("Email address: %s", session_cache.email_address)
+                return True
             else:
                 # Session expired, try to restore using restore keys
-                self.logger.info(f"Session {session_id} expired, attempting to restore using restore keys...")
+                self.logger.info("Session %s expired, attempting to restore using restore keys...", session_id)
                 
                 if session_cache.restore_keys:
                     success = self._restore_using_keys(session_cache.restore_keys)
                     if success:
-                        self.logger.info(f"Successfully restored expired Session using restore keys")
-                        self.logger.info(f"Email address: {session_cache.email_address}")
+                        self.logger.info("Successfully restored expired Session using restore keys")
+                        self.logger.info("Email address: %s", session_cache.email_address)
                         # Update session info in cache
                         self._update_restored_session(session_id, session_cache)
                         return True
                     else:
-                        self.logger.warning(f"Failed to restore Session using restore keys")
+                        self.logger.warning("Failed to restore Session using restore keys")
                         return False
                 else:
-                    self.logger.warning(f"No restore keys available for Session {session_id}")
+                    self.logger.warning("No restore keys available for Session %s", session_id)
                     return False
                 
         except Exception as e:
-            self.logger.error(f"Failed to restore Session: {e}")
+            self.logger.error("Failed to restore Session: %s", e)
             return False
     
     def _restore_using_keys(self, restore_keys: List[str]) -> bool:
@@ -336,21 +808,12 @@ class DropMail:
             new_session = self.create_session()
             new_session_id = self.session_id
         except Exception as e:
-            self.logger.error(f"Failed to create new session: {e}")
+            self.logger.error("Failed to create new session: %s", e)
             return False
         
         for restore_key in restore_keys:
             try:
                 # Try with sessionId parameter
-                query = """
-                mutation($input: RestoreAddressInput!) {
-                    restoreAddress(input: $input) {
-                        id,
-                        address,
-                        restoreKey
-                    }
-                }
-                """
                 variables = {
                     "input": {
                         "sessionId": new_session_id,
@@ -359,8 +822,8 @@ class DropMail:
                     }
                 }
                 
-                data = self._make_request(query, variables)
-                
+                data = self._make_request(_Q_RESTORE_ADDRESS, variables)
+
                 if "restoreAddress" in data and data["restoreAddress"]:
                     restore_data = data["restoreAddress"]
                     
@@ -371,12 +834,12 @@ class DropMail:
                         restore_key=restore_data["restoreKey"]
                     )]
                     
-                    self.logger.info(f"Successfully restored address: {restore_data['address']}")
+                    self.logger.info("Successfully restored address: %s", restore_data['address'])
                     return True
                 
             except Exception as e:
                 # Restore keys can expire, this is expected behavior
-                self.logger.debug(f"Restore attempt failed: {str(e)[:100]}...")
+                self.logger.debug("Restore attempt failed: %.100s...", e)
                 continue
         
         self.logger.info("All restore keys have expired - this is normal for old sessions")
@@ -391,30 +854,21 @@ class DropMail:
             session_cache: Original session cache data
         """
         try:
-            sessions_data = self._load_cache()
-            
             # Update with new session info
             session_cache.session_id = self.session_id
             session_cache.last_accessed = datetime.now().isoformat()
             session_cache.restore_keys = [addr.restore_key for addr in self.addresses]
-            
-            # Get new expiration time
-            session_info = self.get_session_info()
-            if session_info:
-                session_cache.expires_at = session_info.expires_at
-            
-            # Remove old session and add new one
-            if old_session_id in sessions_data:
-                del sessions_data[old_session_id]
-            
-            sessions_data[self.session_id] = session_cache.to_dict()
-            
-            # Write to file
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(sessions_data, f, indent=2, ensure_ascii=False)
+
+            # New expiration time is already known from create_session
+            if self._current_expires_at:
+                session_cache.expires_at = self._current_expires_at
+
+            # Remove old session and add new one in the journal
+            self._append_cache_op("delete", old_session_id)
+            self._append_cache_op("upsert", self.session_id, session_cache.to_dict())
                 
         except Exception as e:
-            self.logger.error(f"Failed to update restored session: {e}")
+            self.logger.error("Failed to update restored session: %s", e)
     
     def _verify_session(self) -> bool:
         """
@@ -423,49 +877,79 @@ class DropMail:
         Returns:
             Whether session is valid
         """
+        return self._fetch_session_brief() is not None
+
+    def _fetch_session_brief(self) -> Optional[Dict[str, Any]]:
+        """
+        Fetch minimal session data (id, expiresAt, addresses) in one query
+
+        Much cheaper than get_session_info, which also pulls the full
+        mail list.
+
+        Returns:
+            Raw session dictionary, or None if the session is invalid
+        """
         if not self.session_id:
-            return False
-        
+            return None
+
         try:
-            query = f"""
-            query {{
-              session(id: "{self.session_id}") {{
-                id
-                expiresAt
-              }}
-            }}
-            """
-            
-            response = self._make_request(query)
-            return response.get('session') is not None
-            
+            data = self._make_request(_Q_SESSION_BRIEF, {"sessionId": self.session_id})
+            return data.get('session')
+
         except Exception:
-            return False
+            return None
+
+    def _fetch_expires_at(self) -> Optional[str]:
+        """
+        Fetch only the current session's expiration time
+
+        Returns:
+            expiresAt string, or None if unavailable
+        """
+        if not self.session_id:
+            return None
+
+        try:
+            data = self._make_request(_Q_EXPIRES_AT, {"sessionId": self.session_id})
+            session = data.get('session')
+            return session.get('expiresAt') if session else None
+
+        except Exception:
+            return None
     
     def _update_last_accessed(self, session_id: str) -> None:
         """
         Update session's last accessed time
-        
+
+        Throttled: polling calls this on every get_mails, so the journal
+        write (and expiry refresh round-trip) runs at most once per minute.
+
         Args:
             session_id: Session ID
         """
+        now = time.monotonic()
+        if now - self._last_accessed_write < self._LAST_ACCESSED_MIN_INTERVAL:
+            return
+
         try:
             sessions_data = self._load_cache()
-            
+
             if session_id in sessions_data:
-                sessions_data[session_id]['last_accessed'] = datetime.now().isoformat()
-                
-                # Update expiration time
-                session_info = self.get_session_info()
-                if session_info:
-                    sessions_data[session_id]['expires_at'] = session_info.expires_at
-                
-                with open(self.cache_file, 'w', encoding='utf-8') as f:
-                    json.dump(sessions_data, f, indent=2, ensure_ascii=False)
-                    
+                data = dict(sessions_data[session_id])
+                data['last_accessed'] = datetime.now().isoformat()
+
+                # Expiry is usually piggybacked on the mail queries; fall
+                # back to the minimal single-field query otherwise
+                expires_at = self._current_expires_at or self._fetch_expires_at()
+                if expires_at:
+                    data['expires_at'] = expires_at
+
+                self._append_cache_op("upsert", session_id, data)
+                self._last_accessed_write = now
+
         except Exception as e:
-            self.logger.error(f"Failed to update last accessed time: {e}")
-    
+            self.logger.error("Failed to update last accessed time: %s", e)
+
     def _remove_expired_session(self, session_id: str) -> None:
         """
         Remove expired session from cache
@@ -477,16 +961,48 @@ class DropMail:
             sessions_data = self._load_cache()
             
             if session_id in sessions_data:
-                del sessions_data[session_id]
-                
-                with open(self.cache_file, 'w', encoding='utf-8') as f:
-                    json.dump(sessions_data, f, indent=2, ensure_ascii=False)
-                    
-                self.logger.info(f"Removed expired Session: {session_id}")
+                self._append_cache_op("delete", session_id)
+
+                self.logger.info("Removed expired Session: %s", session_id)
                 
         except Exception as e:
-            self.logger.error(f"Failed to remove expired Session: {e}")
+            self.logger.error("Failed to remove expired Session: %s", e)
     
+    def _verify_session_group(self, token: str, group: List[SessionCache]) -> List[str]:
+        """
+        Verify one auth-token group of sessions with a single aliased query
+
+        Posts to the group's endpoint directly instead of going through
+        _make_request, so concurrent probes never mutate instance state.
+
+        Args:
+            token: Auth token shared by the group
+            group: Cached sessions to verify
+
+        Returns:
+            IDs of sessions the server no longer knows about
+        """
+        query = "query {\n" + "\n".join(
+            f'    s{i}: session(id: "{sc.session_id}") {{ id expiresAt }}'
+            for i, sc in enumerate(group)
+        ) + "\n}"
+
+        try:
+            response = self._http.post(
+                f"{self.base_url}/{token}",
+                json={"query": query}, timeout=_TIMEOUT
+            )
+            response.raise_for_status()
+            payload = _json_loads(response.content).get("data") or {}
+        except Exception as e:
+            self.logger.error("Failed to verify session batch: %s", e)
+            return []
+
+        return [
+            sc.session_id for i, sc in enumerate(group)
+            if not payload.get(f"s{i}")
+        ]
+
     def cleanup_expired_sessions(self) -> int:
         """
         Clean up all expired sessions
@@ -495,25 +1011,41 @@ class DropMail:
             Number of cleaned sessions
         """
         sessions = self.list_cached_sessions()
-        expired_count = 0
-        
+        if not sessions:
+            return 0
+
+        # Sessions whose cached expiry is already past need no network
+        # verification at all; group the rest by auth token so aliased
+        # fields let one request verify a whole group
+        expired_ids: List[str] = []
+        by_token: Dict[str, List[SessionCache]] = {}
         for session_cache in sessions:
-            # Temporarily switch to that session for verification
-            old_token = self.auth_token
-            old_session = self.session_id
-            
-            self.auth_token = session_cache.auth_token
-            self.session_id = session_cache.session_id
-            
-            if not self._verify_session():
-                self._remove_expired_session(session_cache.session_id)
-                expired_count += 1
-            
-            # Restore original settings
-            self.auth_token = old_token
-            self.session_id = old_session
-        
-        return expired_count
+            if self._is_expired(session_cache.expires_at):
+                expired_ids.append(session_cache.session_id)
+            else:
+                by_token.setdefault(session_cache.auth_token, []).append(session_cache)
+
+        # Verify token groups concurrently; each probe posts to its own
+        # endpoint directly, so instance session state is never touched
+        if len(by_token) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(by_token))) as executor:
+                for group_expired in executor.map(
+                    lambda item: self._verify_session_group(*item), by_token.items()
+                ):
+                    expired_ids.extend(group_expired)
+        else:
+            for token, group in by_token.items():
+                expired_ids.extend(self._verify_session_group(token, group))
+
+        # Remove all expired sessions with a single compacting rewrite
+        if expired_ids:
+            sessions_data = self._load_cache()
+            for session_id in expired_ids:
+                sessions_data.pop(session_id, None)
+                self.logger.info("Removed expired Session: %s", session_id)
+            self._flush_cache(sessions_data)
+
+        return len(expired_ids)
     
     def _make_request(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -526,24 +1058,16 @@ class DropMail:
         Returns:
             API response data
         """
-        url = f"{self.base_url}/{self.auth_token}"
-        
-        payload = {
-            "query": query
-        }
-        
-        if variables:
-            payload["variables"] = variables
-            
-        headers = {
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.post(url, json=payload, headers=headers)
+        # Pre-encode the body ourselves (orjson when available) instead of
+        # letting requests run the stdlib encoder via json=; an empty
+        # variables map is valid GraphQL, so no conditional insert needed
+        body = _json_dumps_line({"query": query, "variables": variables or {}})
+
+        response = self._http.post(self._endpoint, data=body, timeout=_TIMEOUT)
         response.raise_for_status()
         
-        data = response.json()
-        
+        data = _json_loads(response.content)
+
         if "errors" in data:
             raise Exception(f"GraphQL Error: {data['errors']}")
             
@@ -552,21 +1076,19 @@ class DropMail:
     def get_domains(self) -> List[Dict[str, Any]]:
         """
         Get available domain list
-        
+
+        The list changes rarely, so results are memoized for five minutes;
+        repeated session creations skip the round-trip.
+
         Returns:
             Domain list
         """
-        query = """
-        query {
-            domains {
-                id,
-                name,
-                availableVia
-            }
-        }
-        """
-        
-        data = self._make_request(query)
+        if (self._domains_cache is not None
+                and time.monotonic() - self._domains_cache[0] < self._DOMAINS_TTL):
+            return self._domains_cache[1]
+
+        data = self._make_request(_Q_DOMAINS)
+        self._domains_cache = (time.monotonic(), data["domains"])
         return data["domains"]
     
     def create_session(self, domain_id: Optional[str] = None, prefer_com: bool = True) -> Session:
@@ -583,57 +1105,35 @@ class DropMail:
         # If no domain specified and prefer_com is True, try to find .com domain
         if not domain_id and prefer_com:
             try:
+                # Use first .com domain found, without an intermediate list
                 domains = self.get_domains()
-                com_domains = [d for d in domains if d.get('name', '').endswith('.com')]
-                if com_domains:
-                    # Use first .com domain found
-                    domain_id = com_domains[0]['id']
+                domain_id = next(
+                    (d['id'] for d in domains if d.get('name', '').endswith('.com')),
+                    None
+                )
             except:
                 pass  # Fall back to random domain
         
         if domain_id:
-            query = """
-            mutation($domainId: ID!) {
-                introduceSession(input: {withAddress: true, domainId: $domainId}) {
-                    id,
-                    expiresAt,
-                    addresses {
-                        id,
-                        address,
-                        restoreKey
-                    }
-                }
-            }
-            """
+            query = _Q_INTRODUCE_SESSION_DOMAIN
             variables = {"domainId": domain_id}
         else:
-            query = """
-            mutation {
-                introduceSession {
-                    id,
-                    expiresAt,
-                    addresses {
-                        id,
-                        address,
-                        restoreKey
-                    }
-                }
-            }
-            """
+            query = _Q_INTRODUCE_SESSION
             variables = None
-        
+
         data = self._make_request(query, variables)
         session_data = data["introduceSession"]
         
         # Parse address data
-        addresses = []
-        for addr_data in session_data["addresses"]:
-            addresses.append(Address(
-                id=addr_data["id"],
-                address=addr_data["address"],
-                restore_key=addr_data.get("restoreKey", "")
-            ))
-        
+        addresses = [
+            Address(
+                addr_data["id"],
+                addr_data["address"],
+                addr_data.get("restoreKey", "")
+            )
+            for addr_data in session_data["addresses"]
+        ]
+
         # Create session object
         session = Session(
             id=session_data["id"],
@@ -645,6 +1145,7 @@ class DropMail:
         # Save session information
         self.session_id = session.id
         self.addresses = addresses
+        self._current_expires_at = session.expires_at
         
         # Auto save to cache - but don't save yet, wait for successful registration
         # self.save_session()
@@ -665,28 +1166,12 @@ class DropMail:
             raise Exception("No active session. Please create a session first.")
         
         if domain_id:
-            query = """
-            mutation($sessionId: ID!, $domainId: ID!) {
-                introduceAddress(input: {sessionId: $sessionId, domainId: $domainId}) {
-                    id,
-                    address,
-                    restoreKey
-                }
-            }
-            """
+            query = _Q_INTRODUCE_ADDRESS_DOMAIN
             variables = {"sessionId": self.session_id, "domainId": domain_id}
         else:
-            query = """
-            mutation($sessionId: ID!) {
-                introduceAddress(input: {sessionId: $sessionId}) {
-                    id,
-                    address,
-                    restoreKey
-                }
-            }
-            """
+            query = _Q_INTRODUCE_ADDRESS
             variables = {"sessionId": self.session_id}
-        
+
         data = self._make_request(query, variables)
         addr_data = data["introduceAddress"]
         
@@ -715,60 +1200,29 @@ class DropMail:
         
         return self.addresses[0].address
     
-    def get_mails(self, after_mail_id: Optional[str] = None) -> List[Mail]:
+    def get_mails(self, after_mail_id: Optional[str] = None,
+                  include_raw: bool = False) -> List[Mail]:
         """
         Get email list
-        
+
         Args:
             after_mail_id: Get emails after specified email ID
-            
+            include_raw: Also fetch the full RFC 5322 source of each mail;
+                off by default since it inflates every response
+
         Returns:
             Email list
         """
         if not self.session_id:
             raise Exception("No active session. Please create a session first.")
-        
+
         if after_mail_id:
-            query = """
-            query($sessionId: ID!, $mailId: ID!) {
-                session(id: $sessionId) {
-                    mailsAfterId(mailId: $mailId) {
-                        id,
-                        fromAddr,
-                        toAddr,
-                        headerSubject,
-                        text,
-                        html,
-                        receivedAt,
-                        rawSize,
-                        downloadUrl,
-                        raw
-                    }
-                }
-            }
-            """
+            query = _Q_GET_MAILS_AFTER_RAW if include_raw else _Q_GET_MAILS_AFTER
             variables = {"sessionId": self.session_id, "mailId": after_mail_id}
         else:
-            query = """
-            query($sessionId: ID!) {
-                session(id: $sessionId) {
-                    mails {
-                        id,
-                        fromAddr,
-                        toAddr,
-                        headerSubject,
-                        text,
-                        html,
-                        receivedAt,
-                        rawSize,
-                        downloadUrl,
-                        raw
-                    }
-                }
-            }
-            """
+            query = _Q_GET_MAILS_RAW if include_raw else _Q_GET_MAILS
             variables = {"sessionId": self.session_id}
-        
+
         data = self._make_request(query, variables)
         
         if not data["session"]:
@@ -776,29 +1230,60 @@ class DropMail:
         
         mail_field = "mailsAfterId" if after_mail_id else "mails"
         mails_data = data["session"][mail_field]
-        
-        mails = []
-        for mail_data in mails_data:
-            mail = Mail(
-                id=mail_data["id"],
-                from_addr=mail_data["fromAddr"],
-                to_addr=mail_data["toAddr"],
-                subject=mail_data.get("headerSubject", ""),
-                text=mail_data.get("text", ""),
-                html=mail_data.get("html"),
-                received_at=mail_data["receivedAt"],
-                raw_size=mail_data["rawSize"],
-                download_url=mail_data["downloadUrl"],
-                raw=mail_data.get("raw")
+
+        # The query piggybacks expiresAt, so the throttled last-accessed
+        # update below gets a fresh expiry without its own round-trip
+        expires_at = data["session"].get("expiresAt")
+        if expires_at:
+            self._current_expires_at = expires_at
+        
+        # Positional construction: cheaper than the kwargs path for the
+        # many short-lived Mail instances built while polling
+        mails = [
+            Mail(
+                mail_data["id"],
+                mail_data["fromAddr"],
+                mail_data["toAddr"],
+                mail_data.get("headerSubject", ""),
+                mail_data.get("text", ""),
+                mail_data.get("html"),
+                mail_data["receivedAt"],
+                mail_data["rawSize"],
+                mail_data["downloadUrl"],
+                mail_data.get("raw")
             )
-            mails.append(mail)
+            for mail_data in mails_data
+        ]
         
         # Update last accessed time
         if self.session_id:
             self._update_last_accessed(self.session_id)
-        
+
         return mails
-    
+
+    def fetch_raw(self, mail_id: str) -> Optional[str]:
+        """
+        Fetch the full RFC 5322 source of a single mail
+
+        Args:
+            mail_id: Mail ID
+
+        Returns:
+            Raw mail source, or None if not found
+        """
+        if not self.session_id:
+            raise Exception("No active session. Please create a session first.")
+
+        data = self._make_request(_Q_MAIL_RAW, {"sessionId": self.session_id})
+
+        if not data["session"]:
+            raise Exception("Session not found or expired")
+
+        return next(
+            (m.get("raw") for m in data["session"]["mails"] if m["id"] == mail_id),
+            None
+        )
+
     def wait_for_mail(self, timeout: int = 300, check_interval: int = 5) -> Optional[Mail]:
         """
         Wait to receive email
@@ -810,39 +1295,108 @@ class DropMail:
         Returns:
             Received email, returns None if timeout
         """
+        if not self.session_id:
+            raise Exception("No active session. Please create a session first.")
+
         start_time = time.time()
         last_mail_id = None
-        
-        # Get existing emails
-        existing_mails = self.get_mails()
-        if existing_mails:
-            last_mail_id = existing_mails[-1].id
-        
+
+        # Seed last_mail_id with an id-only query instead of fetching
+        # the full existing inbox
+        try:
+            data = self._make_request(_Q_MAIL_IDS, {"sessionId": self.session_id})
+            if data["session"] and data["session"]["mails"]:
+                last_mail_id = data["session"]["mails"][-1]["id"]
+        except Exception as e:
+            self.logger.error("Error checking for mails: %s", e)
+
+        empty_polls = 0
+        poll_errors = 0
+
         while time.time() - start_time < timeout:
             try:
+                # Probe with an id-only projection; the full mail fields are
+                # only transferred and parsed once a new id actually shows up
                 if last_mail_id:
-                    new_mails = self.get_mails(after_mail_id=last_mail_id)
+                    data = self._make_request(
+                        _Q_MAIL_IDS_AFTER,
+                        {"sessionId": self.session_id, "mailId": last_mail_id}
+                    )
+                    rows = data["session"]["mailsAfterId"] if data["session"] else []
                 else:
-                    new_mails = self.get_mails()
-                
-                if new_mails:
-                    return new_mails[0]  # Return first new email
-                
-                time.sleep(check_interval)
-                
+                    data = self._make_request(_Q_MAIL_IDS, {"sessionId": self.session_id})
+                    rows = data["session"]["mails"] if data["session"] else []
+
+                if rows:
+                    # Hydrate the new mail with the full field set
+                    if last_mail_id:
+                        new_mails = self.get_mails(after_mail_id=last_mail_id)
+                    else:
+                        new_mails = self.get_mails()
+                    if new_mails:
+                        return new_mails[0]  # Return first new email
+
+                empty_polls += 1
+                poll_errors = 0
+
             except Exception as e:
-                self.logger.error(f"Error checking for mails: {e}")
-                time.sleep(check_interval)
-        
+                # A transient outage fails every poll; log the first failure
+                # of a streak at error level and debounce the repeats
+                if poll_errors % 10 == 0:
+                    self.logger.error("Error checking for mails: %s", e)
+                else:
+                    self.logger.debug("Error checking for mails: %s", e)
+                poll_errors += 1
+                empty_polls += 1
+
+            # Exponential backoff with jitter: poll eagerly at first, damp
+            # down as the wait drags on instead of hammering a fixed interval
+            delay = min(30.0, check_interval * (1.5 ** empty_polls))
+            delay += random.uniform(0, 0.5)
+
+            remaining = timeout - (time.time() - start_time)
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+
         return None
     
-    def send_email(self, to_email: str, subject: str, body: str, 
+    @contextmanager
+    def smtp_session(self, smtp_server: str = "smtp.gmail.com", smtp_port: int = 587,
+                     from_email: Optional[str] = None, password: Optional[str] = None):
+        """
+        Open a logged-in SMTP session to reuse across several send_email calls
+
+        TLS negotiation and login dominate the cost of sending a single
+        mail; batch senders should open this once and pass it to send_email.
+
+        Args:
+            smtp_server: SMTP server address
+            smtp_port: SMTP server port
+            from_email: Sender email
+            password: Sender email password
+
+        Yields:
+            Connected and authenticated smtplib.SMTP instance
+        """
+        if not from_email or not password:
+            raise Exception("Sending email requires sender email and password")
+
+        server = smtplib.SMTP(smtp_server, smtp_port)
+        try:
+            server.starttls()  # Enable TLS encryption
+            server.login(from_email, password)
+            yield server
+        finally:
+            server.quit()
+
+    def send_email(self, to_email: str, subject: str, body: str,
                    smtp_server: str = "smtp.gmail.com", smtp_port: int = 587,
                    from_email: Optional[str] = None, password: Optional[str] = None,
-                   is_html: bool = False) -> bool:
+                   is_html: bool = False, smtp: Optional[smtplib.SMTP] = None) -> bool:
         """
         Send email (using external SMTP server)
-        
+
         Args:
             to_email: Recipient email
             subject: Email subject
@@ -852,118 +1406,99 @@ class DropMail:
             from_email: Sender email
             password: Sender email password
             is_html: Whether HTML format
-            
+            smtp: Already-open SMTP session (see smtp_session); when given,
+                the connection is reused instead of opened per message
+
         Returns:
             Whether send was successful
         """
         if not from_email or not password:
             raise Exception("Sending email requires sender email and password")
-        
+
         try:
-            # Create email object
-            msg = MIMEMultipart()
+            # Create email object; send_message avoids the as_string pass
+            msg = EmailMessage()
             msg['From'] = from_email
             msg['To'] = to_email
             msg['Subject'] = subject
-            
+
             # Add email content
             if is_html:
-                msg.attach(MIMEText(body, 'html'))
+                msg.add_alternative(body, subtype='html')
             else:
-                msg.attach(MIMEText(body, 'plain'))
-            
-            # Connect to SMTP server and send email
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()  # Enable TLS encryption
-            server.login(from_email, password)
-            
-            text = msg.as_string()
-            server.sendmail(from_email, to_email, text)
-            server.quit()
-            
+                msg.set_content(body)
+
+            # Reuse the caller's connection or open one for this message
+            if smtp is not None:
+                smtp.send_message(msg)
+            else:
+                with self.smtp_session(smtp_server, smtp_port, from_email, password) as server:
+                    server.send_message(msg)
+
             return True
-            
+
         except Exception as e:
-            self.logger.error(f"Failed to send email: {e}")
+            self.logger.error("Failed to send email: %s", e)
             return False
     
-    def get_session_info(self) -> Optional[Session]:
+    def get_session_info(self, include_mails: bool = True) -> Optional[Session]:
         """
         Get current session information
-        
+
+        Args:
+            include_mails: Also fetch and parse the mail list; pass False
+                when only the session metadata and addresses are needed
+
         Returns:
             Session information, returns None if no active session
         """
         if not self.session_id:
             return None
-        
-        query = """
-        query($sessionId: ID!) {
-            session(id: $sessionId) {
-                id,
-                expiresAt,
-                addresses {
-                    id,
-                    address,
-                    restoreKey
-                },
-                mails {
-                    id,
-                    fromAddr,
-                    toAddr,
-                    headerSubject,
-                    text,
-                    html,
-                    receivedAt,
-                    rawSize,
-                    downloadUrl
-                }
-            }
-        }
-        """
-        
+
         variables = {"sessionId": self.session_id}
-        
+        query = _Q_SESSION_INFO if include_mails else _Q_SESSION_BRIEF
+
         try:
             data = self._make_request(query, variables)
-            
+
             if not data["session"]:
                 return None
-            
+
             session_data = data["session"]
-            
-            # Parse address data
-            addresses = []
-            for addr_data in session_data["addresses"]:
-                addresses.append(Address(
-                    id=addr_data["id"],
-                    address=addr_data["address"],
-                    restore_key=addr_data.get("restoreKey", "")
-                ))
-            
+
+            # Parse address data (positional construction, see get_mails)
+            addresses = [
+                Address(
+                    addr_data["id"],
+                    addr_data["address"],
+                    addr_data.get("restoreKey", "")
+                )
+                for addr_data in session_data["addresses"]
+            ]
+
             # Parse email data
-            mails = []
-            for mail_data in session_data["mails"]:
-                mail = Mail(
-                    id=mail_data["id"],
-                    from_addr=mail_data["fromAddr"],
-                    to_addr=mail_data["toAddr"],
-                    subject=mail_data.get("headerSubject", ""),
-                    text=mail_data.get("text", ""),
-                    html=mail_data.get("html"),
-                    received_at=mail_data["receivedAt"],
-                    raw_size=mail_data["rawSize"],
-                    download_url=mail_data["downloadUrl"]
+            mails = [
+                Mail(
+                    mail_data["id"],
+                    mail_data["fromAddr"],
+                    mail_data["toAddr"],
+                    mail_data.get("headerSubject", ""),
+                    mail_data.get("text", ""),
+                    mail_data.get("html"),
+                    mail_data["receivedAt"],
+                    mail_data["rawSize"],
+                    mail_data["downloadUrl"]
                 )
-                mails.append(mail)
-            
+                for mail_data in session_data.get("mails", [])
+            ]
+
             return Session(
                 id=session_data["id"],
                 expires_at=session_data["expiresAt"],
                 addresses=addresses,
                 mails=mails
             )
-            
+
         except Exception as e:
-            self.logger.error(f"Failed to get session information: {e}")
+            self.logger.error("Failed to get session information: %s", e)
             return None
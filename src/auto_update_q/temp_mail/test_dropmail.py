@@ -4,11 +4,22 @@ DropMail Test File
 Tests various functions of the DropMail class
 """
 
+import json
 import unittest
 from unittest.mock import patch, MagicMock
 from dropmail import DropMail, Mail, Address, Session
 
 
+def _mock_response(payload):
+    """Build a mocked requests response carrying the encoded payload"""
+    # _make_request decodes response.content itself, so the mock must
+    # expose real JSON bytes rather than a json.return_value
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(payload).encode('utf-8')
+    mock_response.raise_for_status.return_value = None
+    return mock_response
+
+
 class TestDropMail(unittest.TestCase):
     """DropMail test class"""
     
@@ -27,21 +38,18 @@ class TestDropMail(unittest.TestCase):
         self.assertIsNotNone(dm2.auth_token)
         self.assertGreaterEqual(len(dm2.auth_token), 8)
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_get_domains(self, mock_post):
         """Test getting domain list"""
         # Mock API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_post.return_value = _mock_response({
             "data": {
                 "domains": [
                     {"id": "1", "name": "dropmail.me", "availableVia": ["API"]},
                     {"id": "2", "name": "10mail.org", "availableVia": ["API"]}
                 ]
             }
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        })
         
         domains = self.dropmail.get_domains()
         
@@ -49,12 +57,11 @@ class TestDropMail(unittest.TestCase):
         self.assertEqual(domains[0]["name"], "dropmail.me")
         self.assertEqual(domains[1]["name"], "10mail.org")
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_session(self, mock_post):
         """Test creating session"""
         # Mock API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_post.return_value = _mock_response({
             "data": {
                 "introduceSession": {
                     "id": "session123",
@@ -68,9 +75,7 @@ class TestDropMail(unittest.TestCase):
                     ]
                 }
             }
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        })
         
         session = self.dropmail.create_session()
         
@@ -79,15 +84,14 @@ class TestDropMail(unittest.TestCase):
         self.assertEqual(session.addresses[0].address, "test@dropmail.me")
         self.assertEqual(self.dropmail.session_id, "session123")
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_get_mails(self, mock_post):
         """Test getting emails"""
         # First set session ID
         self.dropmail.session_id = "session123"
         
         # Mock API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_post.return_value = _mock_response({
             "data": {
                 "session": {
                     "mails": [
@@ -105,9 +109,7 @@ class TestDropMail(unittest.TestCase):
                     ]
                 }
             }
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        })
         
         mails = self.dropmail.get_mails()
         
@@ -157,8 +159,28 @@ class TestDropMail(unittest.TestCase):
         self.assertTrue(success)
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once_with("sender@gmail.com", "password123")
-        mock_server.sendmail.assert_called_once()
+        mock_server.send_message.assert_called_once()
         mock_server.quit.assert_called_once()
+
+    @patch('smtplib.SMTP')
+    def test_send_email_reuses_injected_smtp(self, mock_smtp):
+        """Test sending email over an already-open SMTP connection"""
+        mock_server = MagicMock()
+
+        success = self.dropmail.send_email(
+            to_email="recipient@example.com",
+            subject="Test Subject",
+            body="Test Body",
+            from_email="sender@gmail.com",
+            password="password123",
+            smtp=mock_server
+        )
+
+        self.assertTrue(success)
+        mock_server.send_message.assert_called_once()
+        # No new connection is opened or torn down on the reuse path
+        mock_smtp.assert_not_called()
+        mock_server.quit.assert_not_called()
     
     def test_send_email_without_credentials(self):
         """Test sending email without credentials"""